@@ -10,6 +10,8 @@ Always review 'play.py' before running with PyAutoGUI!
 import json
 import platform
 
+play_script_header = "import time\nimport pyautogui\n\n"
+
 key_mappings = {
     "cmd": "win",
     "alt_l": "alt",
@@ -32,72 +34,76 @@ def read_json_file():
     with open('recording.json') as f:
         recording = json.load(f)
 
-    def excluded_actions(object):
-        return "released" not in object["action"]# and \
-               #"scroll" not in object["action"]
-
-    recording = list(filter(excluded_actions, recording))
+    recording = [
+        step for step in recording
+        if "released" not in step["action"]# and \
+           #"scroll" not in step["action"]
+    ]
 
     return recording
 
 
-def convert_to_pyautogui_script(recording):
+def generate_script_lines(recording):
     """
-    Converts to a Python template script 'play.py' to 
-    use with PyAutoGUI.
-
-    Converts the:
-
-    - Mouse clicks
-    - Keyboard input
-    - Time between actions calculated
+    Yields the lines of the 'play.py' script, one
+    recorded step at a time.
     """
-    if not recording: 
-        return
-    
-    output = open("play.py", "w")
-    output.write("import time\n")
-    output.write("import pyautogui\n\n")
-    
-    for i, step in enumerate(recording):
-        print(step)
+    yield play_script_header
 
+    for i, step in enumerate(recording):
         not_first_element = (i - 1) > 0
         if not_first_element:
             ## compare time to previous time for the 'sleep' with a 10% buffer
             pause_in_seconds = (step["_time"] - recording[i - 1]["_time"]) * 1.1 
 
-            output.write(f"time.sleep({pause_in_seconds})\n\n")
+            yield f"time.sleep({pause_in_seconds})\n\n"
         else:
-            output.write("time.sleep(1)\n\n")
+            yield "time.sleep(1)\n\n"
 
         if step["action"] == "pressed_key":
-            key = step["key"].replace("Key.", "") if "Key." in step["key"] else step["key"]
-
-            if key in key_mappings.keys():
-                key = key_mappings[key]
+            key = step["key"].replace("Key.", "")
+            key = key_mappings.get(key, key)
 
-            output.write(f"pyautogui.press('{key}')\n")
+            yield f"pyautogui.press('{key}')\n"
         
         if step["action"] == "clicked":
-            output.write(f"pyautogui.moveTo({step['x']}, {step['y']})\n")
+            yield f"pyautogui.moveTo({step['x']}, {step['y']})\n"
 
             if step["button"] == "Button.right":
-                output.write("pyautogui.mouseDown(button='right')\n")
+                yield "pyautogui.mouseDown(button='right')\n"
             else:
-                output.write("pyautogui.mouseDown()\n")
+                yield "pyautogui.mouseDown()\n"
 
         if step["action"] == "unclicked":
-            output.write(f"pyautogui.moveTo({step['x']}, {step['y']})\n")
+            yield f"pyautogui.moveTo({step['x']}, {step['y']})\n"
 
             if step["button"] == "Button.right":
-                output.write("pyautogui.mouseUp(button='right')\n")
+                yield "pyautogui.mouseUp(button='right')\n"
             else:
-                output.write("pyautogui.mouseUp()\n")
+                yield "pyautogui.mouseUp()\n"
 
         if step["action"] == "scroll":
-            output.write(f"pyautogui.scroll({step['vertical_direction']}, x={step['x']}, y={step['y']})\n")
+            yield f"pyautogui.scroll({step['vertical_direction']}, x={step['x']}, y={step['y']})\n"
+
+
+def convert_to_pyautogui_script(recording):
+    """
+    Converts to a Python template script 'play.py' to 
+    use with PyAutoGUI.
+
+    Converts the:
+
+    - Mouse clicks
+    - Keyboard input
+    - Time between actions calculated
+    """
+    if not recording: 
+        return
+
+    print("\n".join(str(step) for step in recording))
 
+    with open("play.py", "w") as output:
+        output.writelines(generate_script_lines(recording))
 
     print("Recording converted. Saved to 'play.py'")
 
@@ -62,15 +62,16 @@ def on_release(key):
 
 def on_move(x, y):
     if len(recording) >= 1:
+        now = time.time()
         if (recording[-1]['action'] == "pressed" and \
             recording[-1]['button'] == 'Button.left') or \
             (recording[-1]['action'] == "moved" and \
-            time.time() - recording[-1]['_time'] > 0.02):
+            now - recording[-1]['_time'] > 0.02):
             json_object = {
                 'action':'moved', 
                 'x':x, 
                 'y':y, 
-                '_time':time.time()
+                '_time':now
             }
 
             recording.append(json_object)